@@ -6,13 +6,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from .const import CONF_DISCOVERY, DOMAIN
 from .coordinator import NetworkSwitchCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Network Switch from a config entry."""
     coordinator = NetworkSwitchCoordinator(hass, entry)
+    # Reuse the last discovery so a restart only polls port states
+    coordinator.restore_discovery(entry.options.get(CONF_DISCOVERY))
     await coordinator.async_config_entry_first_refresh()
 
     if DOMAIN not in hass.data:
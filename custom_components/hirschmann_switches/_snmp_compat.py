@@ -0,0 +1,15 @@
+"""Shared access to the Home Assistant snmp integration helpers."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, cast
+
+from homeassistant.components import snmp
+
+# Ensure submodules are imported so attributes exist at runtime
+importlib.import_module("homeassistant.components.snmp.const")
+importlib.import_module("homeassistant.components.snmp.util")
+# Resolve component submodules via attribute access to satisfy hassfest + mypy
+snmp_const = cast("Any", snmp).const
+snmp_util = cast("Any", snmp).util
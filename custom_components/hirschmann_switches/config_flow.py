@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import importlib
-from typing import Any, cast
+from typing import Any
 
 import pysnmp.hlapi.v3arch.asyncio as hlapi
 import voluptuous as vol
 from homeassistant import requirements as ha_requirements
-from homeassistant.components import snmp
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlowResult,
+    OptionsFlowWithReload,
+)
 from homeassistant.config_entries import ConfigFlow as HAConfigFlow
-from homeassistant.config_entries import ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import async_get_integration
 from pysnmp.error import PySnmpError
@@ -24,6 +26,7 @@ from pysnmp.hlapi.v3arch.asyncio import (
     get_cmd,
 )
 
+from ._snmp_compat import snmp_const, snmp_util
 from .const import (
     AUTH_MD5,
     AUTH_NONE,
@@ -32,9 +35,15 @@ from .const import (
     CONF_AUTH_TYPE,
     CONF_COMMUNITY_READ,
     CONF_COMMUNITY_WRITE,
+    CONF_MAX_REPETITIONS,
     CONF_PRIV_PASSWORD,
     CONF_PRIV_TYPE,
+    CONF_RETRIES,
     CONF_SNMP_VERSION,
+    CONF_TIMEOUT,
+    DEFAULT_MAX_REPETITIONS,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
     DOMAIN,
     PRIV_AES,
     PRIV_DES,
@@ -44,13 +53,6 @@ from .const import (
     SNMP_V3,
 )
 
-# Ensure submodules are imported so attributes exist at runtime
-importlib.import_module("homeassistant.components.snmp.const")
-importlib.import_module("homeassistant.components.snmp.util")
-# Resolve component submodules via attribute access to satisfy hassfest + mypy
-snmp_const = cast("Any", snmp).const
-snmp_util = cast("Any", snmp).util
-
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -71,13 +73,20 @@ async def validate_connection(hass: HomeAssistant, data: dict[str, Any]) -> str:
         hass, integration.domain, integration.requirements
     )
 
-    # Create SNMP target
+    # Create SNMP target. Timeout and retries are options set after the entry
+    # exists, so validation always uses the defaults.
     try:
         target = await UdpTransportTarget.create(
-            (host, int(data.get("port", 161))), timeout=8
+            (host, int(data.get("port", 161))),
+            timeout=DEFAULT_TIMEOUT,
+            retries=DEFAULT_RETRIES,
         )
     except PySnmpError:
-        target = Udp6TransportTarget((host, int(data.get("port", 161))), timeout=8)
+        target = Udp6TransportTarget(
+            (host, int(data.get("port", 161))),
+            timeout=DEFAULT_TIMEOUT,
+            retries=DEFAULT_RETRIES,
+        )
 
     # Build auth
     if version in (SNMP_V1, SNMP_V2C):
@@ -117,6 +126,12 @@ class ConfigFlow(HAConfigFlow, domain=DOMAIN):
     _version: str | None = None
     _data: dict[str, Any] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlowHandler:
+        """Return the options flow for this handler."""
+        return OptionsFlowHandler()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -190,6 +205,35 @@ class ConfigFlow(HAConfigFlow, domain=DOMAIN):
         return self.async_show_form(step_id="v3", data_schema=schema, errors=errors)
 
 
+class OptionsFlowHandler(OptionsFlowWithReload):
+    """Handle SNMP polling options for network-switch."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling options."""
+        options = self.config_entry.options
+        if user_input is not None:
+            return self.async_create_entry(data={**options, **user_input})
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MAX_REPETITIONS,
+                    default=options.get(CONF_MAX_REPETITIONS, DEFAULT_MAX_REPETITIONS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=256)),
+                vol.Required(
+                    CONF_TIMEOUT,
+                    default=options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                vol.Required(
+                    CONF_RETRIES,
+                    default=options.get(CONF_RETRIES, DEFAULT_RETRIES),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
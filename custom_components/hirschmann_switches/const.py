@@ -10,6 +10,11 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
 
 DEFAULT_PORT = 161
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
+DEFAULT_MAX_REPETITIONS = 64
+DEFAULT_TIMEOUT = 2  # seconds per SNMP request
+DEFAULT_RETRIES = 1
+# Re-run port and device discovery after this long even if nothing changed
+DISCOVERY_MAX_AGE = timedelta(hours=24)
 
 # Config keys
 CONF_SNMP_VERSION = "snmp_version"
@@ -20,6 +25,13 @@ CONF_AUTH_PASSWORD = "auth_password"
 CONF_PRIV_TYPE = "priv_type"
 CONF_PRIV_PASSWORD = "priv_password"
 
+# Option keys
+CONF_MAX_REPETITIONS = "max_repetitions"
+CONF_TIMEOUT = "timeout"
+CONF_RETRIES = "retries"
+# Persisted discovery results (ports, PoE mapping, device meta)
+CONF_DISCOVERY = "discovery"
+
 # SNMP versions
 SNMP_V1 = "v1"
 SNMP_V2C = "v2c"
@@ -34,6 +46,11 @@ PRIV_NONE = "none"
 PRIV_DES = "des"
 PRIV_AES = "aes"
 
+# Device info flavors shared by the entities of one switch
+DEVICE_INFO_GENERIC = "generic"
+DEVICE_INFO_HIRSCHMANN = "hirschmann"
+DEVICE_INFO_POE = "poe"
+
 # OIDs
 OID_SYSNAME = "1.3.6.1.2.1.1.5.0"
 OID_IFTYPE = "1.3.6.1.2.1.2.2.1.3"
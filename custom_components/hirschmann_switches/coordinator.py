@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import importlib
+import asyncio
 import logging
+from collections.abc import Mapping
+from enum import Enum
+from types import MappingProxyType
 from typing import Any, cast
 
 import pysnmp.hlapi.v3arch.asyncio as hlapi
-from homeassistant.components import snmp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from pysnmp.error import PySnmpError
 from pysnmp.hlapi.v3arch.asyncio import (
     CommunityData,
@@ -19,17 +23,32 @@ from pysnmp.hlapi.v3arch.asyncio import (
     UsmUserData,
     bulk_walk_cmd,
     get_cmd,
+    next_cmd,
     set_cmd,
 )
+from pysnmp.proto.errind import RequestTimedOut
 from pysnmp.proto.rfc1902 import Integer
+from pysnmp.proto.rfc1905 import EndOfMibView, NoSuchInstance, NoSuchObject
 
+from ._snmp_compat import snmp_const, snmp_util
 from .const import (
     AUTH_MD5,
     AUTH_NONE,
     AUTH_SHA,
+    CONF_DISCOVERY,
+    CONF_MAX_REPETITIONS,
+    CONF_RETRIES,
     CONF_SNMP_VERSION,
+    CONF_TIMEOUT,
+    DEFAULT_MAX_REPETITIONS,
     DEFAULT_PORT,
+    DEFAULT_RETRIES,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DEVICE_INFO_HIRSCHMANN,
+    DEVICE_INFO_POE,
+    DISCOVERY_MAX_AGE,
+    DOMAIN,
     OID_BRIDGE_ADDR,
     OID_DEVICE_TEMPERATURE,
     OID_FW_VER_BASE,
@@ -41,7 +60,6 @@ from .const import (
     OID_PETH_PORT_ADMIN_ENABLE,
     OID_PETH_PORT_DETECT_STATUS,
     OID_PETH_PORT_POWER_W,
-    OID_PETH_PORT_TABLE,
     OID_POE_POWER_W,
     OID_SYSNAME,
     OID_SYSUPTIME,
@@ -55,11 +73,18 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-# Resolve component submodules via attribute access to satisfy hassfest + mypy
-importlib.import_module("homeassistant.components.snmp.const")
-importlib.import_module("homeassistant.components.snmp.util")
-snmp_const = cast("Any", snmp).const
-snmp_util = cast("Any", snmp).util
+# SNMPv2 exception values returned in place of a missing varbind
+_NO_VALUE_TYPES = (NoSuchObject, NoSuchInstance, EndOfMibView)
+
+# Error-status an agent returns when the response exceeds its size limit
+_ERROR_STATUS_TOO_BIG = 1
+# SNMPv1 error-status for a missing OID (v2c reports exception values instead)
+_ERROR_STATUS_NO_SUCH_NAME = 2
+# Conservative max-repetitions tried once after a walk reply went missing
+_SAFE_MAX_REPETITIONS = 8
+
+# Static device meta keys kept with the persisted discovery
+_PERSISTED_META_KEYS = ("sys_name", "mac", "hardware", "firmware", "poe_power_w")
 
 
 def _safe_str(value: Any) -> str:
@@ -69,16 +94,39 @@ def _safe_str(value: Any) -> str:
         return repr(value)
 
 
+class _NoSuch(Enum):
+    """Marker for a value the agent reported as nonexistent."""
+
+    VALUE = "no_such_value"
+
+
+# Distinguishes "the agent has no such OID" from None ("the request failed")
+_NO_SUCH = _NoSuch.VALUE
+
+
+class _WalkResponseTooLargeError(Exception):
+    """A GETBULK reply was rejected as tooBig or never arrived."""
+
+    def __init__(self, reason: Any, *, timed_out: bool) -> None:
+        super().__init__(str(reason))
+        self.timed_out = timed_out
+
+
 def normalize_port_name(name: str) -> str:
     """Return a simplified port name without stack prefixes."""
-    parts = name.split("/")
-    if len(parts) > 2:
-        return "/".join(parts[1:])
+    if name.count("/") > 1:
+        # Drop the leading stack/unit component, e.g. "1/1/5" -> "1/5"
+        return name.partition("/")[2]
     return name
 
 
 class _V3ArchBackend:
-    """Async pysnmp v3arch backend (v1/v2c/v3), aligned with snmp integration."""
+    """
+    Async pysnmp v3arch backend (v1/v2c/v3), aligned with snmp integration.
+
+    Only numeric OIDs are used, so responses skip MIB resolution and carry
+    raw (ObjectName, value) pairs.
+    """
 
     def __init__(
         self,
@@ -87,21 +135,33 @@ class _V3ArchBackend:
         port: int,
         version: str,
         entry_data: dict[str, Any],
+        max_repetitions: int = DEFAULT_MAX_REPETITIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
     ) -> None:
         self.hass = hass
         self.host = host
         self.port = port
         self.version = version
         self.entry_data = entry_data
+        self.max_repetitions = max_repetitions
+        self.timeout = timeout
+        self.retries = retries
         self._auth_data: UsmUserData | CommunityData | None = None
         self._target: UdpTransportTarget | Udp6TransportTarget | None = None
         self._cmd_args: tuple | None = None
+        # Polled OIDs are fixed, so build their ObjectType only once
+        self._obj_cache: dict[str, hlapi.ObjectType] = {}
 
     async def async_init(self) -> None:
         try:
-            target = await UdpTransportTarget.create((self.host, self.port), timeout=8)
+            target = await UdpTransportTarget.create(
+                (self.host, self.port), timeout=self.timeout, retries=self.retries
+            )
         except PySnmpError:
-            target = Udp6TransportTarget((self.host, self.port), timeout=8)
+            target = Udp6TransportTarget(
+                (self.host, self.port), timeout=self.timeout, retries=self.retries
+            )
 
         if self.version in (SNMP_V1, SNMP_V2C):
             mp_model = 0 if self.version == SNMP_V1 else 1
@@ -128,10 +188,18 @@ class _V3ArchBackend:
 
         self._auth_data = auth_data
         self._target = target
+        # The snmp integration hands out one process-wide SnmpEngine, so all
+        # config entries share its dispatcher and UDP transport
         self._cmd_args = await snmp_util.async_create_command_cmd_args(
             self.hass, auth_data, target
         )
 
+    def _object_type(self, oid: str) -> hlapi.ObjectType:
+        """Return the cached request ObjectType for an OID."""
+        if (obj := self._obj_cache.get(oid)) is None:
+            obj = self._obj_cache[oid] = hlapi.ObjectType(hlapi.ObjectIdentity(oid))
+        return obj
+
     async def async_get(self, oid: str):
         if self._cmd_args is None:
             await self.async_init()
@@ -142,11 +210,86 @@ class _V3ArchBackend:
             auth,
             target,
             context,
-            hlapi.ObjectType(hlapi.ObjectIdentity(oid)),
+            self._object_type(oid),
+        )
+        return await get_cmd(*req_args, lookupMib=False)
+
+    async def async_multi_get(self, *oids: str) -> list[Any]:
+        """GET several OIDs in one PDU; nonexistent values come back as _NO_SUCH."""
+        if self._cmd_args is None:
+            await self.async_init()
+        assert self._cmd_args is not None
+        engine, auth, target, context = self._cmd_args
+        err, status, _idx, var_binds = await get_cmd(
+            engine,
+            auth,
+            target,
+            context,
+            *(self._object_type(oid) for oid in oids),
+            lookupMib=False,
+        )
+        if err:
+            raise UpdateFailed(str(err))
+        if status:
+            if int(status) != _ERROR_STATUS_NO_SUCH_NAME:
+                raise UpdateFailed(str(status))
+            # SNMPv1 agents reject the whole PDU if any OID is missing
+            if len(oids) > 1:
+                rows = await asyncio.gather(*(self.async_multi_get(o) for o in oids))
+                return [row[0] for row in rows]
+            return [_NO_SUCH]
+        return [
+            _NO_SUCH if isinstance(vb[1], _NO_VALUE_TYPES) else vb[1]
+            for vb in var_binds
+        ]
+
+    async def async_get_next(self, oid: str):
+        if self._cmd_args is None:
+            await self.async_init()
+        assert self._cmd_args is not None
+        engine, auth, target, context = self._cmd_args
+        return await next_cmd(
+            engine, auth, target, context, self._object_type(oid), lookupMib=False
         )
-        return await get_cmd(*req_args)
 
     async def async_walk(self, base_oid: str) -> list[tuple[Any, Any]]:
+        """Walk a subtree, shrinking max-repetitions if responses are too large."""
+        max_repetitions = self.max_repetitions
+        retried_timeout = False
+        while True:
+            try:
+                results = await self._async_bulk_walk(base_oid, max_repetitions)
+            except _WalkResponseTooLargeError as err:
+                if err.timed_out:
+                    # The reply may have been dropped for size, or lost, or the
+                    # agent may be gone; retry this walk once at a small size
+                    # but do not remember it, as a timeout proves nothing
+                    if retried_timeout or max_repetitions <= _SAFE_MAX_REPETITIONS:
+                        raise UpdateFailed(str(err)) from err
+                    retried_timeout = True
+                    max_repetitions = _SAFE_MAX_REPETITIONS
+                else:
+                    if max_repetitions <= 1:
+                        raise UpdateFailed(str(err)) from err
+                    max_repetitions //= 2
+                    # tooBig is a definite size limit, so later walks start
+                    # below it; min() keeps concurrent walks from compounding
+                    self.max_repetitions = min(self.max_repetitions, max_repetitions)
+                _LOGGER.debug(
+                    "Walk of %s on %s failed (%s), retrying with max-repetitions %s",
+                    base_oid,
+                    self.host,
+                    err,
+                    max_repetitions,
+                )
+                continue
+            except PySnmpError as err:
+                raise UpdateFailed(str(err)) from err
+            return results
+
+    async def _async_bulk_walk(
+        self, base_oid: str, max_repetitions: int
+    ) -> list[tuple[Any, Any]]:
         if self._cmd_args is None:
             await self.async_init()
         assert self._cmd_args is not None
@@ -157,15 +300,21 @@ class _V3ArchBackend:
             target,
             context,
             0,
-            50,
-            hlapi.ObjectType(hlapi.ObjectIdentity(base_oid)),
+            max_repetitions,
+            self._object_type(base_oid),
             lexicographicMode=False,
+            lookupMib=False,
         )
         results: list[tuple[Any, Any]] = []
         async for errind, errstat, _erridx, res in walker:
+            if isinstance(errind, RequestTimedOut):
+                raise _WalkResponseTooLargeError(errind, timed_out=True)
+            if not errind and errstat and int(errstat) == _ERROR_STATUS_TOO_BIG:
+                raise _WalkResponseTooLargeError(errstat, timed_out=False)
             if errind or errstat:
                 raise UpdateFailed(str(errind or errstat))
-            results.extend([(vb[0], vb[1]) for vb in res])
+            # rows are already (ObjectName, value) pairs with lookupMib off
+            results.extend(res)
         return results
 
     async def async_set_integer(self, oid: str, value: int) -> None:
@@ -182,7 +331,9 @@ class _V3ArchBackend:
                     write_comm, mpModel=(0 if self.version == SNMP_V1 else 1)
                 )
         obj = hlapi.ObjectType(hlapi.ObjectIdentity(oid), Integer(value))
-        err, status, _idx, _rest = await set_cmd(engine, auth, target, context, obj)
+        err, status, _idx, _rest = await set_cmd(
+            engine, auth, target, context, obj, lookupMib=False
+        )
         if err or status:
             raise UpdateFailed(str(err or status))
 
@@ -194,7 +345,7 @@ class NetworkSwitchCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]])
         """Initialize coordinator with Home Assistant and config entry."""
         super().__init__(
             hass,
-            logger=logging.getLogger(__name__),
+            logger=_LOGGER,
             name="Hirschmann",
             update_interval=DEFAULT_SCAN_INTERVAL,
             config_entry=entry,
@@ -203,299 +354,505 @@ class NetworkSwitchCoordinator(DataUpdateCoordinator[dict[int, dict[str, Any]]])
         self._host = entry.data["host"]
         self._port = entry.data.get("port", DEFAULT_PORT)
         self._version = entry.data[CONF_SNMP_VERSION]
-        self._backend: _V3ArchBackend | None = _V3ArchBackend(
-            hass, self._host, self._port, self._version, dict(entry.data)
+        self._backend = _V3ArchBackend(
+            hass,
+            self._host,
+            self._port,
+            self._version,
+            dict(entry.data),
+            max_repetitions=entry.options.get(
+                CONF_MAX_REPETITIONS, DEFAULT_MAX_REPETITIONS
+            ),
+            timeout=entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+            retries=entry.options.get(CONF_RETRIES, DEFAULT_RETRIES),
         )
 
         # Discovered Ethernet ports: index -> name
         self._ports: dict[int, str] = {}
+        self._normalized_ports: dict[int, str] = {}
+        # ifAdminStatus OID per port, built once for the SET path
+        self._admin_oids: dict[int, str] = {}
         self._device_meta: dict[str, Any] = {}
+        # Read-only view handed to entities; avoids copying on every state read
+        self._device_meta_view = MappingProxyType(self._device_meta)
+        # Bumped whenever the static device meta changes
+        self._device_meta_version = 0
+        self._device_info_cache: dict[tuple[int, str], DeviceInfo] = {}
+        # Device registry connections, shared by every device info variant
+        self._connections: frozenset[tuple[str, str]] = frozenset()
         # Map ifIndex -> "group.port" for pethPsePortTable rows
         self._poe_index: dict[int, str] = {}
+        # pethPsePortAdminEnable OID per PoE port
+        self._poe_admin_oids: dict[int, str] = {}
+        # Set once a PoE discovery walk succeeded, even if it found no ports
+        self._poe_discovered = False
+        # Instance OID of the temperature scalar once located
+        self._temperature_oid: str | None = None
+        # Timestamp of the last port/device discovery
+        self._discovered_at: float | None = None
+        self._discovery_dirty = False
+
+    def restore_discovery(self, discovery: dict[str, Any] | None) -> None:
+        """Restore persisted discovery results unless they are too old."""
+        if not discovery:
+            return
+        discovered_at = discovery.get("discovered_at")
+        if (
+            not isinstance(discovered_at, (int, float))
+            or dt_util.utcnow().timestamp() - discovered_at
+            > DISCOVERY_MAX_AGE.total_seconds()
+        ):
+            return
+        try:
+            ports = {int(idx): str(name) for idx, name in discovery["ports"].items()}
+            poe_index = {
+                int(idx): str(gp) for idx, gp in discovery["poe_index"].items()
+            }
+            meta = dict(discovery["device_meta"])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return
+        self._set_ports(ports)
+        self._set_poe_index(poe_index)
+        self._poe_discovered = discovery.get("poe_discovered") is True
+        self._device_meta.update(meta)
+        self._device_meta_changed()
+        self._discovered_at = discovered_at
+
+    def _discovery_expired(self) -> bool:
+        if self._discovered_at is None:
+            return True
+        age = dt_util.utcnow().timestamp() - self._discovered_at
+        return age > DISCOVERY_MAX_AGE.total_seconds()
+
+    def _async_store_discovery(self) -> None:
+        """Persist discovery results in the entry options for the next start."""
+        discovery = {
+            "discovered_at": self._discovered_at,
+            "ports": {str(idx): name for idx, name in self._ports.items()},
+            "poe_index": {str(idx): gp for idx, gp in self._poe_index.items()},
+            "poe_discovered": self._poe_discovered,
+            "device_meta": {
+                key: self._device_meta[key]
+                for key in _PERSISTED_META_KEYS
+                if key in self._device_meta
+            },
+        }
+        self._discovery_dirty = False
+        self.hass.config_entries.async_update_entry(
+            self.entry, options={**self.entry.options, CONF_DISCOVERY: discovery}
+        )
 
     async def async_close(self) -> None:
         """Close resources (no-op for pysnmp asyncio)."""
-        # pysnmp asyncio engine does not require explicit close
+        # The shared SnmpEngine is owned by the snmp integration, which
+        # unconfigures it on shutdown; it must not be closed per entry
         return
 
-    async def _async_snmp_get(self, oid: str) -> tuple[Any, Any, Any, Any]:
-        if not self._backend:
-            raise UpdateFailed("SNMP backend not initialized")
-        return await self._backend.async_get(oid)
+    def _set_ports(self, ports: dict[int, str]) -> None:
+        """Store discovered ports and the values derived from them."""
+        self._ports = ports
+        # Port names and OIDs are static, so build them once per discovery
+        self._normalized_ports = {
+            idx: normalize_port_name(name) for idx, name in ports.items()
+        }
+        self._admin_oids = {idx: f"{OID_IFADMINSTATUS}.{idx}" for idx in ports}
 
-    async def _async_snmp_walk(self, base_oid: str) -> list[tuple[Any, Any]]:
-        if not self._backend:
-            raise UpdateFailed("SNMP backend not initialized")
-        return await self._backend.async_walk(base_oid)
+    def _set_poe_index(self, poe_index: dict[int, str]) -> None:
+        """Store the PoE port mapping and the per-port admin OIDs."""
+        self._poe_index = poe_index
+        self._poe_admin_oids = {
+            idx: f"{OID_PETH_PORT_ADMIN_ENABLE}.{gp}" for idx, gp in poe_index.items()
+        }
 
     async def _discover_ports(self) -> None:
         """Discover Ethernet ports (ifType=6) and get their names."""
+        iftype_rows, ifname_rows = await asyncio.gather(
+            self._backend.async_walk(OID_IFTYPE), self._backend.async_walk(OID_IFNAME)
+        )
         ethernet_indexes: set[int] = set()
-        for oid, value in await self._walk_simple(OID_IFTYPE):
+        for oid, value in iftype_rows:
             # OID ends with .<index>
             try:
-                index = int(_safe_str(oid).split(".")[-1])
+                index = int(oid[-1])
                 if int(value) == 6:  # ethernetCsmacd(6)
                     ethernet_indexes.add(index)
             except (ValueError, IndexError, TypeError):
                 continue
 
         names: dict[int, str] = {}
-        for oid, value in await self._walk_simple(OID_IFNAME):
+        for oid, value in ifname_rows:
             try:
-                index = int(_safe_str(oid).split(".")[-1])
+                index = int(oid[-1])
             except (ValueError, IndexError, TypeError):
                 continue
             if index in ethernet_indexes:
                 names[index] = _safe_str(value)
-        self._ports = names
+        self._set_ports(names)
 
-    async def _discover_poe(self) -> None:
-        """Discover PoE-capable ports by walking pethPsePortInterfaceIndex and matching to ifIndex."""
+    async def _discover_poe(self) -> list[tuple[Any, Any]]:
+        """
+        Discover PoE-capable ports from the pethPsePortAdminEnable column.
+
+        A single column yields every group.port row without pulling the rest
+        of pethPsePortTable. The rows are returned so the same poll can reuse
+        them as PoE admin state. An empty walk means the switch has no PoE;
+        a failed walk leaves discovery pending for the next poll.
+        """
         mapping: dict[int, str] = {}
         try:
-            rows = await self._async_snmp_walk(OID_PETH_PORT_TABLE)
+            rows = await self._backend.async_walk(OID_PETH_PORT_ADMIN_ENABLE)
         except UpdateFailed:
-            rows = []
+            return []
         for oid, _value in rows:
             try:
                 # suffix is group.port
-                suffix = str(oid).split(".")[-2:]
-                gp = ".".join(suffix)
-                mapping[int(suffix[1])] = gp
+                tup = oid.asTuple()
+                mapping[tup[-1]] = f"{tup[-2]}.{tup[-1]}"
             except (ValueError, IndexError, TypeError):
                 continue
-        self._poe_index = mapping
+        self._set_poe_index(mapping)
+        self._poe_discovered = True
+        return rows
 
-    async def _get_scalar_str(self, oid_base: str) -> str | None:
-        """Get a scalar value as string; try OID and OID.0."""
-        for candidate in (oid_base, f"{oid_base}.0"):
-            try:
-                err, status, _idx, var_binds = await self._async_snmp_get(candidate)
-            except UpdateFailed:
-                continue
-            if err or status or not var_binds:
-                continue
-            return _safe_str(var_binds[0][1])
-        return None
+    async def _get_values(self, *oids: str) -> list[Any]:
+        """
+        Get several values in one request.
 
-    async def _populate_device_meta(self) -> None:
-        """Fetch device-level meta info: sysName, MAC, HW type, FW version."""
-        # sysName
-        sys_name = None
+        Values the agent does not have come back as _NO_SUCH; if the request
+        itself fails, every value is None.
+        """
         try:
-            err, status, _idx, var_binds = await self._async_snmp_get(OID_SYSNAME)
-            if not (err or status) and var_binds:
-                sys_name = _safe_str(var_binds[0][1])
+            return await self._backend.async_multi_get(*oids)
         except UpdateFailed:
-            sys_name = None
+            return [None] * len(oids)
 
-        # bridge MAC address
-        mac_str: str | None = None
+    async def _get_scalar(self, oid_base: str) -> tuple[str, Any] | _NoSuch | None:
+        """
+        Get a scalar exposed at either OID or OID.0 with a single GETNEXT.
+
+        The request starts at the parent node so the agent answers with
+        whichever of the two instances it implements. Returns the instance
+        OID together with its value, _NO_SUCH if the agent implements
+        neither, or None if the request failed.
+        """
         try:
-            err, status, _idx, var_binds = await self._async_snmp_get(OID_BRIDGE_ADDR)
-            if not (err or status) and var_binds:
-                raw = var_binds[0][1]
-                try:
-                    b = bytes(raw)
-                    mac_str = ":".join(f"{x:02x}" for x in b)
-                except (TypeError, ValueError):
-                    mac_str = _safe_str(raw)
+            err, status, _idx, var_binds = await self._backend.async_get_next(
+                oid_base.rpartition(".")[0]
+            )
         except UpdateFailed:
-            mac_str = None
+            return None
+        if err:
+            return None
+        if status:
+            # SNMPv1 signals the end of the MIB view with noSuchName; any
+            # other error-status is a failed request
+            if int(status) == _ERROR_STATUS_NO_SUCH_NAME:
+                return _NO_SUCH
+            return None
+        if not var_binds:
+            return _NO_SUCH
+        oid, value = var_binds[0][0], var_binds[0][1]
+        base = tuple(int(arc) for arc in oid_base.split("."))
+        instance = oid.asTuple()
+        if instance not in (base, (*base, 0)) or isinstance(value, _NO_VALUE_TYPES):
+            return _NO_SUCH
+        return ".".join(str(arc) for arc in instance), value
+
+    async def _get_scalar_str(self, oid_base: str) -> str | None:
+        """Get a scalar value as string; accepts OID or OID.0."""
+        scalar = await self._get_scalar(oid_base)
+        if scalar is None or scalar is _NO_SUCH:
+            return None
+        return _safe_str(scalar[1])
 
-        # Hardware type
-        hw_type = await self._get_scalar_str(OID_HW_TYPE_BASE)
+    async def _populate_device_meta(self) -> None:
+        """Fetch device-level meta info: sysName, MAC, HW type, FW version."""
+        # All lookups are independent, so issue them concurrently
+        (sys_name_raw, mac_raw, poe_raw), hw_type, fw_ver_raw, _ = await asyncio.gather(
+            self._get_values(OID_SYSNAME, OID_BRIDGE_ADDR, OID_POE_POWER_W),
+            self._get_scalar_str(OID_HW_TYPE_BASE),
+            self._get_scalar_str(OID_FW_VER_BASE),
+            self._async_update_device_metrics(),
+        )
+        # Discovery replaces the meta wholesale, so missing and failed are alike
+        sys_name_raw, mac_raw, poe_raw = (
+            None if raw is _NO_SUCH else raw for raw in (sys_name_raw, mac_raw, poe_raw)
+        )
+
+        sys_name = _safe_str(sys_name_raw) if sys_name_raw is not None else None
+
+        # bridge MAC address
+        mac_str: str | None = None
+        if mac_raw is not None:
+            try:
+                mac_str = bytes(mac_raw).hex(":")
+            except (TypeError, ValueError):
+                mac_str = _safe_str(mac_raw)
 
         # Firmware version: trim before "RAM:"
-        fw_ver_raw = await self._get_scalar_str(OID_FW_VER_BASE)
         fw_version = None
         if fw_ver_raw is not None:
             fw_version = fw_ver_raw.split("RAM:", 1)[0].strip()
 
-        self._device_meta = {
-            "sys_name": sys_name,
-            "mac": mac_str,
-            "hardware": hw_type,
-            "firmware": fw_version,
-        }
+        self._device_meta.update(
+            {
+                "sys_name": sys_name,
+                "mac": mac_str,
+                "hardware": hw_type,
+                "firmware": fw_version,
+            }
+        )
         # PoE power budget (Watts), optional
+        poe_w: int | None = None
+        if poe_raw is not None:
+            try:
+                poe_w = int(poe_raw)
+            except (TypeError, ValueError):
+                poe_w = None
+        if poe_w is not None:
+            self._device_meta["poe_power_w"] = poe_w
+        else:
+            self._device_meta.pop("poe_power_w", None)
+        self._device_meta_changed()
+
+    async def _walk_optional(self, base_oid: str) -> list[tuple[Any, Any]]:
+        """Walk a subtree that may not exist on every device."""
         try:
-            err, status, _idx, var_binds = await self._async_snmp_get(OID_POE_POWER_W)
-            if not (err or status) and var_binds:
-                try:
-                    poe_w = int(var_binds[0][1])
-                except (TypeError, ValueError):
-                    poe_w = None
-                if poe_w is not None:
-                    self._device_meta["poe_power_w"] = poe_w
+            return await self._backend.async_walk(base_oid)
         except UpdateFailed:
-            # Ignore if not available
-            pass
+            return []
 
-        await self._async_update_device_metrics()
+    async def _async_read_poe(
+        self, admin_rows: list[tuple[Any, Any]] | None = None
+    ) -> tuple[dict[str, bool], dict[str, str], dict[int, int]]:
+        """
+        Read PoE admin, detection and power columns with concurrent walks.
 
-    async def _walk_simple(self, base_oid: str) -> list[tuple[Any, Any]]:
-        vbs = await self._async_snmp_walk(base_oid)
-        return [(vb[0], vb[1]) for vb in vbs]
+        Admin rows already fetched by PoE discovery are reused when given.
+        """
+        walks = [
+            self._walk_optional(OID_PETH_PORT_DETECT_STATUS),
+            self._walk_optional(OID_PETH_PORT_POWER_W),
+        ]
+        if admin_rows is None:
+            walks.append(self._walk_optional(OID_PETH_PORT_ADMIN_ENABLE))
+        detect_rows, power_rows, *rest = await asyncio.gather(*walks)
+        if admin_rows is None:
+            admin_rows = rest[0]
+        enabled: dict[str, bool] = {}
+        for oid, value in admin_rows:
+            try:
+                # suffix is group.port
+                tup = oid.asTuple()
+                enabled[f"{tup[-2]}.{tup[-1]}"] = int(value) == 1
+            except (ValueError, IndexError, TypeError):
+                continue
+        detect: dict[str, str] = {}
+        status_get = PETH_DETECT_STATUS_MAP.get
+        for oid, value in detect_rows:
+            try:
+                tup = oid.asTuple()
+                code = int(value)
+            except (ValueError, IndexError, TypeError):
+                continue
+            detect[f"{tup[-2]}.{tup[-1]}"] = status_get(code, str(code))
+        power: dict[int, int] = {}
+        for oid, value in power_rows:
+            # delivered power (vendor OID per ifIndex)
+            try:
+                power[int(oid[-1])] = int(value)
+            except (ValueError, IndexError, TypeError):
+                continue
+        return enabled, detect, power
 
     async def _async_update_data(self) -> dict[int, dict[str, Any]]:
         """
         Fetch latest port statuses.
 
         Returns a mapping: ifIndex -> {"name": str, "status": "Up"|"Down", "admin_on": bool}
+        where "name" is the normalized port name.
         """
-        if not self._backend:
-            raise UpdateFailed("SNMP backend not available")
-        # On first run, discover ports
-        if not self._ports:
+        # On first run, or when the last discovery is stale, discover ports
+        if not self._ports or self._discovery_expired():
             await self._discover_ports()
             await self._populate_device_meta()
+            self._set_poe_index({})
+            self._poe_discovered = False
+            self._discovered_at = dt_util.utcnow().timestamp()
+            self._discovery_dirty = True
         else:
             await self._async_update_device_metrics()
 
-        # Read operational statuses
+        # Read operational and admin statuses
+        oper_rows, admin_rows = await asyncio.gather(
+            self._backend.async_walk(OID_IFOPERSTATUS),
+            self._backend.async_walk(OID_IFADMINSTATUS),
+        )
         statuses: dict[int, str] = {}
-        for oid, value in await self._walk_simple(OID_IFOPERSTATUS):
+        # OID arcs are ints and rfc1902 Integers compare with ints directly
+        for oid, value in oper_rows:
             try:
-                index = int(_safe_str(oid).split(".")[-1])
-                statuses[index] = "Up" if int(value) == 1 else "Down"
+                statuses[oid[-1]] = "Up" if value == 1 else "Down"
             except (ValueError, IndexError, TypeError):
                 continue
 
-        # Read admin statuses
         admin: dict[int, bool] = {}
-        for oid, value in await self._walk_simple(OID_IFADMINSTATUS):
+        for oid, value in admin_rows:
             try:
-                index = int(_safe_str(oid).split(".")[-1])
-                admin[index] = int(value) == 1  # up(1)=on, down(2)=off
+                admin[oid[-1]] = value == 1  # up(1)=on, down(2)=off
             except (ValueError, IndexError, TypeError):
                 continue
 
-        # Discover PoE mapping once
-        if not self._poe_index:
-            await self._discover_poe()
-
-        result: dict[int, dict[str, Any]] = {}
-        for idx, name in self._ports.items():
-            state = statuses.get(idx, "Down")
-            poe: dict[str, Any] | None = None
-            if idx in self._poe_index:
-                poe = {}
-                gp = self._poe_index[idx]
-                # peth admin enable
-                try:
-                    err, st, _ix, vb = await self._async_snmp_get(
-                        f"{OID_PETH_PORT_ADMIN_ENABLE}.{gp}"
-                    )
-                    poe["enabled"] = not err and not st and vb and int(vb[0][1]) == 1
-                except UpdateFailed:
-                    poe["enabled"] = None
-                # detection status
-                try:
-                    err, st, _ix, vb = await self._async_snmp_get(
-                        f"{OID_PETH_PORT_DETECT_STATUS}.{gp}"
-                    )
-                    if not err and not st and vb:
-                        code = int(vb[0][1])
-                        poe["detection_status"] = PETH_DETECT_STATUS_MAP.get(
-                            code, str(code)
-                        )
-                    else:
-                        poe["detection_status"] = None
-                except UpdateFailed:
-                    poe["detection_status"] = None
-                # delivered power (vendor OID per ifIndex)
-                try:
-                    err, st, _ix, vb = await self._async_snmp_get(
-                        f"{OID_PETH_PORT_POWER_W}.{idx}"
-                    )
-                    if not err and not st and vb:
-                        poe["power_w"] = int(vb[0][1])
-                except UpdateFailed:
-                    pass
-
-            result[idx] = {
+        # A known port missing from ifTable means the ports changed
+        if not self._ports.keys() <= statuses.keys():
+            self._discovered_at = None
+
+        # Discover PoE mapping once per discovery; PoE-less switches keep
+        # an empty index and skip the walk on later polls
+        poe_admin_rows: list[tuple[Any, Any]] | None = None
+        if not self._poe_discovered:
+            poe_admin_rows = await self._discover_poe()
+            self._discovery_dirty |= self._poe_discovered
+
+        poe_enabled: dict[str, bool] = {}
+        poe_detect: dict[str, str] = {}
+        poe_power: dict[int, int] = {}
+        # Non-PoE switches skip the PoE columns entirely
+        if self._poe_index:
+            poe_enabled, poe_detect, poe_power = await self._async_read_poe(
+                poe_admin_rows
+            )
+
+        poe_index_get = self._poe_index.get
+        result: dict[int, dict[str, Any]] = {
+            idx: {
                 "name": name,
-                "status": state,
+                "status": statuses.get(idx, "Down"),
                 "admin_on": admin.get(idx, False),
-                "poe": poe,
+                "poe": {
+                    "enabled": poe_enabled.get(gp),
+                    "detection_status": poe_detect.get(gp),
+                    "power_w": poe_power.get(idx),
+                }
+                if (gp := poe_index_get(idx)) is not None
+                else None,
             }
+            for idx, name in self._normalized_ports.items()
+        }
+
+        if self._discovery_dirty:
+            self._async_store_discovery()
         return result
 
     async def async_test_connection(self) -> str:
         """Test connectivity by querying sysName and return it."""
-        err, status, _idx, var_binds = await self._async_snmp_get(OID_SYSNAME)
+        err, status, _idx, var_binds = await self._backend.async_get(OID_SYSNAME)
         if err or status:
             raise UpdateFailed(str(err or status))
         if not var_binds:
             raise UpdateFailed("No data returned")
-        # var_binds: [(ObjectType(ObjectIdentity(...), value))]
+        # var_binds: [(ObjectName, value)]
         return _safe_str(var_binds[0][1])
 
     async def async_set_admin_status(self, if_index: int, enable: bool) -> None:
         """Set ifAdminStatus for a given interface index to up/down."""
-        # Build full OID
-        oid = f"{OID_IFADMINSTATUS}.{if_index}"
-        if not self._backend:
-            raise UpdateFailed("SNMP backend not initialized")
-        # Delegate to backend
+        oid = self._admin_oids.get(if_index) or f"{OID_IFADMINSTATUS}.{if_index}"
         await self._backend.async_set_integer(oid, 1 if enable else 2)
 
     async def async_set_poe_admin(self, if_index: int, enable: bool) -> None:
         """Enable/disable PoE at pethPsePortAdminEnable for given interface."""
-        if if_index not in self._poe_index:
+        oid = self._poe_admin_oids.get(if_index)
+        if oid is None:
             raise UpdateFailed("PoE not supported on this port")
-        gp = self._poe_index[if_index]
-        oid = f"{OID_PETH_PORT_ADMIN_ENABLE}.{gp}"
-        if not self._backend:
-            raise UpdateFailed("SNMP backend not initialized")
         await self._backend.async_set_integer(oid, 1 if enable else 2)
 
+    def _device_meta_changed(self) -> None:
+        """Invalidate cached device info after the static device meta changed."""
+        self._device_meta_version += 1
+        self._device_info_cache.clear()
+        mac = self._device_meta.get("mac")
+        self._connections = (
+            frozenset(((CONNECTION_NETWORK_MAC, mac),)) if mac else frozenset()
+        )
+
+    def get_device_info(self, variant: str) -> DeviceInfo:
+        """Return the shared device info for the given entity flavor."""
+        key = (self._device_meta_version, variant)
+        if (info := self._device_info_cache.get(key)) is not None:
+            return info
+        meta = self._device_meta
+        info = DeviceInfo(
+            identifiers={(DOMAIN, self._host)},
+            manufacturer="Hirschmann Automation and Control GmbH"
+            if variant == DEVICE_INFO_HIRSCHMANN
+            else "Generic",
+            name=meta.get("sys_name") or f"Network Switch {self._host}",
+        )
+        if self._connections:
+            # The device registry only iterates connections; sharing is safe
+            info["connections"] = cast("set[tuple[str, str]]", self._connections)
+        poe = meta.get("poe_power_w")
+        if variant == DEVICE_INFO_POE and poe is not None:
+            info["model"] = f"PoE budget: {poe} W"
+        elif meta.get("hardware"):
+            info["model"] = meta["hardware"]
+        if meta.get("firmware"):
+            info["sw_version"] = meta["firmware"]
+        self._device_info_cache[key] = info
+        return info
+
     @property
-    def device_meta(self) -> dict[str, Any]:
-        """Return a copy of the device metadata gathered via SNMP."""
-        return dict(self._device_meta)
+    def device_meta(self) -> Mapping[str, Any]:
+        """Return a read-only view of the device metadata gathered via SNMP."""
+        return self._device_meta_view
 
     async def _async_update_device_metrics(self) -> None:
         """Refresh device-level metrics exposed as diagnostics sensors."""
-        await self._async_update_temperature()
-        await self._async_update_uptime()
+        if self._temperature_oid is None:
+            # Locate the temperature instance; later polls batch it with uptime
+            scalar, (uptime_raw,) = await asyncio.gather(
+                self._get_scalar(OID_DEVICE_TEMPERATURE),
+                self._get_values(OID_SYSUPTIME),
+            )
+            temperature_raw: Any = scalar
+            if isinstance(scalar, tuple):
+                self._temperature_oid, temperature_raw = scalar
+        else:
+            temperature_raw, uptime_raw = await self._get_values(
+                self._temperature_oid, OID_SYSUPTIME
+            )
+        self._update_temperature(temperature_raw)
+        self._update_uptime(uptime_raw)
 
-    async def _async_update_temperature(self) -> None:
-        """Fetch current device temperature if available."""
-        found_invalid = False
-        for candidate in (OID_DEVICE_TEMPERATURE, f"{OID_DEVICE_TEMPERATURE}.0"):
-            try:
-                err, status, _idx, var_binds = await self._async_snmp_get(candidate)
-            except UpdateFailed:
-                continue
-            if err or status or not var_binds:
-                continue
-            temperature: int | None
+    def _update_temperature(self, raw_value: Any) -> None:
+        """Store the device temperature; drop it if the agent no longer has one."""
+        if raw_value is None:
+            # Request failed; keep the last reading
+            return
+        if raw_value is _NO_SUCH:
+            self._device_meta.pop("temperature_c", None)
+            return
+        temperature: int | None
+        try:
+            temperature = int(raw_value)
+        except (TypeError, ValueError):
             try:
-                temperature = int(var_binds[0][1])
-            except (TypeError, ValueError):
-                try:
-                    temperature = int(float(_safe_str(var_binds[0][1])))
-                except (ValueError, TypeError):
-                    temperature = None
-            if temperature is not None:
-                self._device_meta["temperature_c"] = temperature
-                return
-            found_invalid = True
-        if found_invalid:
+                temperature = int(float(_safe_str(raw_value)))
+            except (ValueError, TypeError):
+                temperature = None
+        if temperature is not None:
+            self._device_meta["temperature_c"] = temperature
+        else:
             self._device_meta.pop("temperature_c", None)
 
-    async def _async_update_uptime(self) -> None:
-        """Fetch current device uptime (seconds) if available."""
-        try:
-            err, status, _idx, var_binds = await self._async_snmp_get(OID_SYSUPTIME)
-        except UpdateFailed:
+    def _update_uptime(self, raw_value: Any) -> None:
+        """Store the device uptime (seconds); drop it if the agent has none."""
+        if raw_value is None:
+            # Request failed; keep the last reading
             return
-        if err or status or not var_binds:
+        if raw_value is _NO_SUCH:
+            self._device_meta.pop("uptime_seconds", None)
             return
-        raw_value = var_binds[0][1]
         uptime_seconds: float | None
         try:
             ticks = int(raw_value)
@@ -25,6 +25,7 @@ TO_REDACT_ENTRY = {
     CONF_COMMUNITY_WRITE,
     CONF_AUTH_PASSWORD,
     CONF_PRIV_PASSWORD,
+    "mac",
 }
 
 TO_REDACT_DEVICE = {"mac"}
@@ -59,8 +60,7 @@ async def async_get_config_entry_diagnostics(
         "uptime_seconds": device_meta.get("uptime_seconds"),
     }
 
-    diagnostics["ports"] = {
-        str(if_index): data for if_index, data in sorted(coordinator.data.items())
-    }
+    data = coordinator.data
+    diagnostics["ports"] = {str(if_index): data[if_index] for if_index in sorted(data)}
 
     return diagnostics
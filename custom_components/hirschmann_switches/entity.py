@@ -0,0 +1,31 @@
+"""Shared entity helpers for Hirschmann integration."""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from .const import DEVICE_INFO_GENERIC
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.device_registry import DeviceInfo
+
+    from .coordinator import NetworkSwitchCoordinator
+
+
+class SwitchDeviceInfoMixin:
+    """
+    Provide parent-switch device info for coordinator entities.
+
+    List before CoordinatorEntity in the bases so this property wins the MRO.
+    Subclasses pick the presentation via ``_device_info_variant``.
+    """
+
+    coordinator: NetworkSwitchCoordinator
+    _device_info_variant: str = DEVICE_INFO_GENERIC
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info for the parent switch."""
+        # Home Assistant only reads this when registering the entity
+        return self.coordinator.get_device_info(self._device_info_variant)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -10,14 +12,14 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import NetworkSwitchCoordinator, normalize_port_name
+from .const import DEVICE_INFO_POE, DOMAIN
+from .coordinator import NetworkSwitchCoordinator
+from .entity import SwitchDeviceInfoMixin
 
 
 async def async_setup_entry(
@@ -34,173 +36,156 @@ async def async_setup_entry(
             NetworkDeviceUptimeSensor(coordinator),
         ]
     )
-    for if_index in sorted(coordinator.data.keys()):
-        entities.append(NetworkPortSensor(coordinator, if_index))
-        poe = coordinator.data[if_index].get("poe")
-        if poe is not None:
-            entities.append(NetworkPortPoeDetectionSensor(coordinator, if_index))
+    host = entry.data["host"]
+    for if_index, port in sorted(coordinator.data.items()):
+        port_name = port["name"]
+        entities.append(NetworkPortSensor(coordinator, if_index, host, port_name))
+        if port.get("poe") is not None:
+            entities.append(
+                NetworkPortPoeDetectionSensor(coordinator, if_index, host, port_name)
+            )
             # Only add power sensor if we have a value initially or expect availability later
-            entities.append(NetworkPortPoePowerSensor(coordinator, if_index))
+            entities.append(
+                NetworkPortPoePowerSensor(coordinator, if_index, host, port_name)
+            )
     async_add_entities(entities)
 
 
-class NetworkPortSensor(CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity):
+class NetworkPortSensor(
+    SwitchDeviceInfoMixin, CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
+):
     """Represents a port status sensor (Up/Down)."""
 
     _attr_icon = "mdi:ethernet"
 
-    def __init__(self, coordinator: NetworkSwitchCoordinator, if_index: int) -> None:
+    def __init__(
+        self,
+        coordinator: NetworkSwitchCoordinator,
+        if_index: int,
+        host: str | None = None,
+        port_name: str | None = None,
+    ) -> None:
         """Initialize the port status sensor."""
         super().__init__(coordinator)
         self._if_index = if_index
-        host = coordinator.entry.data["host"]
-        port_name = normalize_port_name(coordinator.data[if_index]["name"])
+        self._port: dict[str, Any] | None = coordinator.data.get(if_index)
+        if host is None:
+            host = coordinator.entry.data["host"]
+        if port_name is None:
+            port_name = coordinator.data[if_index]["name"]
         self._attr_name = f"Port {port_name}"
         self._attr_unique_id = f"{host}-port-{if_index}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache this port's data before writing the new state."""
+        self._port = self.coordinator.data.get(self._if_index)
+        super()._handle_coordinator_update()
+
     @property
-    def native_value(self) -> StateType:
-        """Return current operational status (Up/Down)."""
-        data = self.coordinator.data.get(self._if_index)
-        if not data:
-            return None
-        return data["status"]
+    def available(self) -> bool:
+        """Return True if the coordinator is healthy and this port still exists."""
+        return super().available and self._port is not None
 
     @property
-    def device_info(self):
-        """Return device info for the parent switch."""
-        host = self.coordinator.entry.data["host"]
-        meta = getattr(self.coordinator, "_device_meta", {})
-        connections = set()
-        if mac := meta.get("mac"):
-            connections.add((CONNECTION_NETWORK_MAC, mac))
-        name = meta.get("sys_name") or f"Network Switch {host}"
-        info = {
-            "identifiers": {(DOMAIN, host)},
-            "manufacturer": "Generic",
-            "name": name,
-        }
-        if connections:
-            info["connections"] = connections
-        if meta.get("hardware"):
-            info["model"] = meta["hardware"]
-        if meta.get("firmware"):
-            info["sw_version"] = meta["firmware"]
-        return info
+    def native_value(self) -> StateType:
+        """Return current operational status (Up/Down)."""
+        return self._port["status"] if self._port else None
 
 
 class NetworkPortPoeDetectionSensor(
-    CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
+    SwitchDeviceInfoMixin, CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
 ):
     """PoE detection status sensor for a port."""
 
+    _device_info_variant = DEVICE_INFO_POE
     _attr_icon = "mdi:lan-pending"
 
-    def __init__(self, coordinator: NetworkSwitchCoordinator, if_index: int) -> None:
+    def __init__(
+        self,
+        coordinator: NetworkSwitchCoordinator,
+        if_index: int,
+        host: str | None = None,
+        port_name: str | None = None,
+    ) -> None:
         """Initialize the PoE detection status sensor."""
         super().__init__(coordinator)
         self._if_index = if_index
-        host = coordinator.entry.data["host"]
-        name = normalize_port_name(coordinator.data[if_index]["name"])
-        self._attr_name = f"Port {name} PoE Status"
+        self._poe: dict[str, Any] | None = coordinator.data[if_index].get("poe")
+        if host is None:
+            host = coordinator.entry.data["host"]
+        if port_name is None:
+            port_name = coordinator.data[if_index]["name"]
+        self._attr_name = f"Port {port_name} PoE Status"
         self._attr_unique_id = f"{host}-port-poe-detect-{if_index}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache this port's PoE data before writing the new state."""
+        port = self.coordinator.data.get(self._if_index)
+        self._poe = port.get("poe") if port else None
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> StateType:
         """Return PoE detection status text if available."""
-        poe = self.coordinator.data.get(self._if_index, {}).get("poe")
-        if not poe:
+        if not self._poe:
             return None
-        return poe.get("detection_status")
-
-    @property
-    def device_info(self):
-        """Return device info for the parent switch."""
-        # Same device info as other entities
-        host = self.coordinator.entry.data["host"]
-        meta = getattr(self.coordinator, "_device_meta", {})
-        connections = set()
-        if mac := meta.get("mac"):
-            connections.add((CONNECTION_NETWORK_MAC, mac))
-        name = meta.get("sys_name") or f"Network Switch {host}"
-        info = {
-            "identifiers": {(DOMAIN, host)},
-            "manufacturer": "Generic",
-            "name": name,
-        }
-        if connections:
-            info["connections"] = connections
-        poe = meta.get("poe_power_w")
-        if poe is not None:
-            info["model"] = f"PoE budget: {poe} W"
-        elif meta.get("hardware"):
-            info["model"] = meta["hardware"]
-        if meta.get("firmware"):
-            info["sw_version"] = meta["firmware"]
-        return info
+        return self._poe.get("detection_status")
 
 
 class NetworkPortPoePowerSensor(
-    CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
+    SwitchDeviceInfoMixin, CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
 ):
     """PoE delivered power sensor for a port."""
 
+    _device_info_variant = DEVICE_INFO_POE
     _attr_icon = "mdi:flash"
     _attr_native_unit_of_measurement = UnitOfPower.WATT
     _attr_device_class = SensorDeviceClass.POWER
 
-    def __init__(self, coordinator: NetworkSwitchCoordinator, if_index: int) -> None:
+    def __init__(
+        self,
+        coordinator: NetworkSwitchCoordinator,
+        if_index: int,
+        host: str | None = None,
+        port_name: str | None = None,
+    ) -> None:
         """Initialize the PoE power sensor."""
         super().__init__(coordinator)
         self._if_index = if_index
-        host = coordinator.entry.data["host"]
-        name = normalize_port_name(coordinator.data[if_index]["name"])
-        self._attr_name = f"Port {name} PoE Power"
+        self._poe: dict[str, Any] | None = coordinator.data[if_index].get("poe")
+        self._available = self._poe is not None
+        if host is None:
+            host = coordinator.entry.data["host"]
+        if port_name is None:
+            port_name = coordinator.data[if_index]["name"]
+        self._attr_name = f"Port {port_name} PoE Power"
         self._attr_unique_id = f"{host}-port-poe-power-{if_index}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache this port's PoE data before writing the new state."""
+        port = self.coordinator.data.get(self._if_index)
+        self._poe = port.get("poe") if port else None
+        self._available = self._poe is not None
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self) -> StateType:
         """Return delivered power in Watts if available."""
-        poe = self.coordinator.data.get(self._if_index, {}).get("poe")
-        if not poe:
+        if not self._poe:
             return None
-        return poe.get("power_w")
+        return self._poe.get("power_w")
 
     @property
     def available(self) -> bool:
         """Return True if PoE info is available for this port."""
-        poe = self.coordinator.data.get(self._if_index, {}).get("poe")
-        return poe is not None
-
-    @property
-    def device_info(self):
-        """Return device info for the parent switch."""
-        # Same device info as other entities
-        host = self.coordinator.entry.data["host"]
-        meta = getattr(self.coordinator, "_device_meta", {})
-        connections = set()
-        if mac := meta.get("mac"):
-            connections.add((CONNECTION_NETWORK_MAC, mac))
-        name = meta.get("sys_name") or f"Network Switch {host}"
-        info = {
-            "identifiers": {(DOMAIN, host)},
-            "manufacturer": "Generic",
-            "name": name,
-        }
-        if connections:
-            info["connections"] = connections
-        poe = meta.get("poe_power_w")
-        if poe is not None:
-            info["model"] = f"PoE budget: {poe} W"
-        elif meta.get("hardware"):
-            info["model"] = meta["hardware"]
-        if meta.get("firmware"):
-            info["sw_version"] = meta["firmware"]
-        return info
+        return self._available
 
 
 class NetworkDeviceTemperatureSensor(
-    CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
+    SwitchDeviceInfoMixin, CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
 ):
     """Device temperature sensor exposed for diagnostics."""
 
@@ -226,31 +211,9 @@ class NetworkDeviceTemperatureSensor(
         """Return true if a temperature reading is currently available."""
         return self.coordinator.device_meta.get("temperature_c") is not None
 
-    @property
-    def device_info(self):
-        """Return device info for the parent switch."""
-        host = self.coordinator.entry.data["host"]
-        meta = getattr(self.coordinator, "_device_meta", {})
-        connections = set()
-        if mac := meta.get("mac"):
-            connections.add((CONNECTION_NETWORK_MAC, mac))
-        name = meta.get("sys_name") or f"Network Switch {host}"
-        info = {
-            "identifiers": {(DOMAIN, host)},
-            "manufacturer": "Generic",
-            "name": name,
-        }
-        if connections:
-            info["connections"] = connections
-        if meta.get("hardware"):
-            info["model"] = meta["hardware"]
-        if meta.get("firmware"):
-            info["sw_version"] = meta["firmware"]
-        return info
-
 
 class NetworkDeviceUptimeSensor(
-    CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
+    SwitchDeviceInfoMixin, CoordinatorEntity[NetworkSwitchCoordinator], SensorEntity
 ):
     """Device uptime sensor exposed for diagnostics."""
 
@@ -275,25 +238,3 @@ class NetworkDeviceUptimeSensor(
     def available(self) -> bool:
         """Return true if an uptime value is currently available."""
         return self.coordinator.device_meta.get("uptime_seconds") is not None
-
-    @property
-    def device_info(self):
-        """Return device info for the parent switch."""
-        host = self.coordinator.entry.data["host"]
-        meta = getattr(self.coordinator, "_device_meta", {})
-        connections = set()
-        if mac := meta.get("mac"):
-            connections.add((CONNECTION_NETWORK_MAC, mac))
-        name = meta.get("sys_name") or f"Network Switch {host}"
-        info = {
-            "identifiers": {(DOMAIN, host)},
-            "manufacturer": "Generic",
-            "name": name,
-        }
-        if connections:
-            info["connections"] = connections
-        if meta.get("hardware"):
-            info["model"] = meta["hardware"]
-        if meta.get("firmware"):
-            info["sw_version"] = meta["firmware"]
-        return info
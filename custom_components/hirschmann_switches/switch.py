@@ -6,13 +6,13 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import NetworkSwitchCoordinator, normalize_port_name
+from .const import DEVICE_INFO_HIRSCHMANN, DEVICE_INFO_POE, DOMAIN
+from .coordinator import NetworkSwitchCoordinator
+from .entity import SwitchDeviceInfoMixin
 
 
 async def async_setup_entry(
@@ -23,57 +23,58 @@ async def async_setup_entry(
     """Set up Hirschmann switches from a config entry."""
     coordinator: NetworkSwitchCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[SwitchEntity] = []
-    for if_index in sorted(coordinator.data.keys()):
-        entities.append(NetworkPortSwitch(coordinator, if_index))
-        poe = coordinator.data[if_index].get("poe")
-        if poe is not None:
-            entities.append(NetworkPortPoeSwitch(coordinator, if_index))
+    host = entry.data["host"]
+    for if_index, port in sorted(coordinator.data.items()):
+        port_name = port["name"]
+        entities.append(NetworkPortSwitch(coordinator, if_index, host, port_name))
+        if port.get("poe") is not None:
+            entities.append(
+                NetworkPortPoeSwitch(coordinator, if_index, host, port_name)
+            )
     async_add_entities(entities)
 
 
-class NetworkPortSwitch(CoordinatorEntity[NetworkSwitchCoordinator], SwitchEntity):
+class NetworkPortSwitch(
+    SwitchDeviceInfoMixin, CoordinatorEntity[NetworkSwitchCoordinator], SwitchEntity
+):
     """Represents a switch to control ifAdminStatus (on=up, off=down)."""
 
+    _device_info_variant = DEVICE_INFO_HIRSCHMANN
     _attr_icon = "mdi:server-network"
 
-    def __init__(self, coordinator: NetworkSwitchCoordinator, if_index: int) -> None:
+    def __init__(
+        self,
+        coordinator: NetworkSwitchCoordinator,
+        if_index: int,
+        host: str | None = None,
+        port_name: str | None = None,
+    ) -> None:
         """Initialize the admin-status switch."""
         super().__init__(coordinator)
         self._if_index = if_index
-        host = coordinator.entry.data["host"]
-        name = normalize_port_name(coordinator.data[if_index]["name"])
-        self._attr_name = f"Port {name}"
+        self._port: dict[str, Any] | None = coordinator.data.get(if_index)
+        if host is None:
+            host = coordinator.entry.data["host"]
+        if port_name is None:
+            port_name = coordinator.data[if_index]["name"]
+        self._attr_name = f"Port {port_name}"
         self._attr_unique_id = f"{host}-port-admin-{if_index}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache this port's data before writing the new state."""
+        self._port = self.coordinator.data.get(self._if_index)
+        super()._handle_coordinator_update()
+
     @property
-    def is_on(self) -> bool:
-        """Return True if admin status is up (on)."""
-        data = self.coordinator.data.get(self._if_index)
-        if not data:
-            return False
-        return bool(data.get("admin_on", False))
+    def available(self) -> bool:
+        """Return True if the coordinator is healthy and this port still exists."""
+        return super().available and self._port is not None
 
     @property
-    def device_info(self):
-        """Return device info for the parent switch."""
-        host = self.coordinator.entry.data["host"]
-        meta = getattr(self.coordinator, "_device_meta", {})
-        connections = set()
-        if mac := meta.get("mac"):
-            connections.add((CONNECTION_NETWORK_MAC, mac))
-        name = meta.get("sys_name") or f"Network Switch {host}"
-        info = {
-            "identifiers": {(DOMAIN, host)},
-            "manufacturer": "Hirschmann Automation and Control GmbH",
-            "name": name,
-        }
-        if connections:
-            info["connections"] = connections
-        if meta.get("hardware"):
-            info["model"] = meta["hardware"]
-        if meta.get("firmware"):
-            info["sw_version"] = meta["firmware"]
-        return info
+    def is_on(self) -> bool:
+        """Return True if admin status is up (on)."""
+        return bool(self._port["admin_on"]) if self._port else False
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on (set admin status up)."""
@@ -86,60 +87,54 @@ class NetworkPortSwitch(CoordinatorEntity[NetworkSwitchCoordinator], SwitchEntit
         await self.coordinator.async_request_refresh()
 
 
-class NetworkPortPoeSwitch(CoordinatorEntity[NetworkSwitchCoordinator], SwitchEntity):
+class NetworkPortPoeSwitch(
+    SwitchDeviceInfoMixin, CoordinatorEntity[NetworkSwitchCoordinator], SwitchEntity
+):
     """Switch to control PoE enable/disable for a PoE-capable port."""
 
+    _device_info_variant = DEVICE_INFO_POE
     _attr_icon = "mdi:power-plug"
 
-    def __init__(self, coordinator: NetworkSwitchCoordinator, if_index: int) -> None:
+    def __init__(
+        self,
+        coordinator: NetworkSwitchCoordinator,
+        if_index: int,
+        host: str | None = None,
+        port_name: str | None = None,
+    ) -> None:
         """Initialize the PoE control switch."""
         super().__init__(coordinator)
         self._if_index = if_index
-        host = coordinator.entry.data["host"]
-        name = normalize_port_name(coordinator.data[if_index]["name"])
-        self._attr_name = f"Port {name} PoE"
+        self._poe: dict[str, Any] | None = coordinator.data[if_index].get("poe")
+        self._available = self._poe is not None
+        if host is None:
+            host = coordinator.entry.data["host"]
+        if port_name is None:
+            port_name = coordinator.data[if_index]["name"]
+        self._attr_name = f"Port {port_name} PoE"
         self._attr_unique_id = f"{host}-port-poe-{if_index}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache this port's PoE data before writing the new state."""
+        port = self.coordinator.data.get(self._if_index)
+        self._poe = port.get("poe") if port else None
+        self._available = self._poe is not None
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Return True if PoE is available on this port."""
-        return self.coordinator.data.get(self._if_index, {}).get("poe") is not None
+        return self._available
 
     @property
     def is_on(self) -> bool:
         """Return True if PoE admin is enabled for this port."""
-        poe = self.coordinator.data.get(self._if_index, {}).get("poe")
-        if not poe:
+        if not self._poe:
             return False
-        enabled = poe.get("enabled")
+        enabled = self._poe.get("enabled")
         return bool(enabled) if enabled is not None else False
 
-    @property
-    def device_info(self):
-        """Return device info for the parent switch."""
-        # Reuse device info from base switch
-        host = self.coordinator.entry.data["host"]
-        meta = getattr(self.coordinator, "_device_meta", {})
-        connections = set()
-        if mac := meta.get("mac"):
-            connections.add((CONNECTION_NETWORK_MAC, mac))
-        name = meta.get("sys_name") or f"Network Switch {host}"
-        info = {
-            "identifiers": {(DOMAIN, host)},
-            "manufacturer": "Generic",
-            "name": name,
-        }
-        if connections:
-            info["connections"] = connections
-        poe = meta.get("poe_power_w")
-        if poe is not None:
-            info["model"] = f"PoE budget: {poe} W"
-        elif meta.get("hardware"):
-            info["model"] = meta["hardware"]
-        if meta.get("firmware"):
-            info["sw_version"] = meta["firmware"]
-        return info
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable PoE on this port."""
         await self.coordinator.async_set_poe_admin(self._if_index, True)